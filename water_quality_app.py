@@ -3,8 +3,14 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+from collections import deque
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+import csv
+import io
 import json
+import sys
 
 # Page configuration
 st.set_page_config(
@@ -15,7 +21,10 @@ st.set_page_config(
 )
 
 # Custom CSS for better mobile responsiveness and accessibility
-st.markdown("""
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    """Return the static CSS block once; cached so reruns skip rebuilding it"""
+    return """
     <style>
     .main {
         padding: 0rem 1rem;
@@ -70,83 +79,165 @@ st.markdown("""
         text-align: center;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _header_html():
+    """Return the static page header HTML once; cached like the CSS block"""
+    return """
+        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 1rem; margin-bottom: 2rem;'>
+            <h1 style='color: white; margin: 0;'>💧 Water Quality Monitor</h1>
+            <p style='color: white; margin: 0.5rem 0 0 0;'>AI-Powered Water Potability Prediction | 89.07% Accuracy</p>
+        </div>
+    """
+
+_APP_DIR = Path(__file__).parent
+
+@st.cache_data(show_spinner=False)
+def _load_markdown(name):
+    """Read a static markdown asset shipped next to the app, once per worker"""
+    return (_APP_DIR / name).read_text(encoding='utf-8')
+
+# Default values for water parameters; read-only so it is built once at import
+_DEFAULTS = MappingProxyType({
+    'ph': 7.0,
+    'hardness': 200.0,
+    'solids': 400.0,
+    'chloramines': 3.0,
+    'sulfate': 200.0,
+    'conductivity': 350.0,
+    'organic_carbon': 1.5,
+    'trihalomethanes': 60.0,
+    'turbidity': 3.0
+})
+
+# Quick Fill presets; applied through _fill_form so the writes land in an
+# on_click callback, before the form widgets are instantiated
+_SAFE_EXAMPLE = MappingProxyType({
+    'ph': 7.2,
+    'hardness': 180.0,
+    'solids': 350.0,
+    'chloramines': 2.5,
+    'sulfate': 180.0,
+    'conductivity': 320.0,
+    'organic_carbon': 1.2,
+    'trihalomethanes': 45.0,
+    'turbidity': 2.8
+})
+_UNSAFE_EXAMPLE = MappingProxyType({
+    'ph': 5.2,
+    'hardness': 450.0,
+    'solids': 1200.0,
+    'chloramines': 6.5,
+    'sulfate': 380.0,
+    'conductivity': 650.0,
+    'organic_carbon': 4.8,
+    'trihalomethanes': 120.0,
+    'turbidity': 8.5
+})
+
+def _fill_form(values):
+    """Write a preset into the form's widget keys.
+
+    Runs as a button callback: callbacks execute before the script body, so
+    assigning to widget keys here is legal (after the widgets are instantiated
+    it would raise StreamlitAPIException), and the rerun the click triggers
+    renders the form with the new values - no explicit st.rerun() needed.
+    """
+    for param, value in values.items():
+        st.session_state[param] = value
+
+# History is capped at 50 tests; bounded deques make inserts O(1) with no
+# reslicing (was insert(0) + [:50] re-allocation per test)
+_HISTORY_MAXLEN = 50
+
+def _empty_history():
+    """Columnar history store: one bounded deque per field, newest first"""
+    return {
+        'timestamp': deque(maxlen=_HISTORY_MAXLEN),
+        'potable': deque(maxlen=_HISTORY_MAXLEN),
+        'confidence': deque(maxlen=_HISTORY_MAXLEN),
+        'quality': deque(maxlen=_HISTORY_MAXLEN),
+        'data': deque(maxlen=_HISTORY_MAXLEN),
+        'params_display': deque(maxlen=_HISTORY_MAXLEN)
+    }
 
 # Initialize session state for all parameters
 def initialize_session_state():
     """Initialize all session state variables"""
     if 'history' not in st.session_state:
-        st.session_state.history = []
-    
-    # Default values for water parameters
-    defaults = {
-        'ph': 7.0,
-        'hardness': 200.0,
-        'solids': 400.0,
-        'chloramines': 3.0,
-        'sulfate': 200.0,
-        'conductivity': 350.0,
-        'organic_carbon': 1.5,
-        'trihalomethanes': 60.0,
-        'turbidity': 3.0
-    }
-    
-    for param, value in defaults.items():
+        st.session_state.history = _empty_history()
+
+    for param, value in _DEFAULTS.items():
         if param not in st.session_state:
             st.session_state[param] = value
 
+# Upper-bound validation rules (key, limit, warning), WHO/EPA based:
+# hardness >500 very hard; TDS WHO <600 acceptable, EPA <500 recommended;
+# chloramines EPA 4.0 max; sulfate WHO 500; conductivity typical 50-1500;
+# organic carbon <2 typical treated; THMs EPA 80 max; turbidity WHO <5
+_VALIDATION_RULES = (
+    ('hardness', 500.0, "⚠️ Water hardness is extremely high (>500 mg/L)"),
+    ('solids', 1500.0, "⚠️ Total Dissolved Solids is extremely high (>1500 ppm)"),
+    ('chloramines', 8.0, "⚠️ Chloramines level is extremely high (>8 ppm)"),
+    ('sulfate', 500.0, "⚠️ Sulfate level exceeds WHO guideline (>500 mg/L)"),
+    ('conductivity', 1500.0, "⚠️ Conductivity is extremely high (>1500 μS/cm)"),
+    ('organic_carbon', 5.0, "⚠️ Organic carbon is extremely high (>5 ppm)"),
+    ('trihalomethanes', 160.0, "⚠️ Trihalomethanes significantly exceed EPA limit (>160 μg/L)"),
+    ('turbidity', 10.0, "⚠️ Turbidity is extremely high (>10 NTU)"),
+)
+_VALIDATION_LIMITS = np.array([limit for _, limit, _ in _VALIDATION_RULES])
+
 def validate_input(data):
     """
     Validate water quality input data and return warnings
     Based on WHO and EPA drinking water standards
     """
     warnings = []
-    
-    # pH validation (typical drinking water: 6.5-8.5, realistic range: 4-10)
+
+    # pH is the one two-tier check (realistic range supersedes WHO range),
+    # so it stays scalar; the remaining limits are a single vector compare
     if data['ph'] < 4 or data['ph'] > 10:
         warnings.append("⚠️ pH is outside realistic range for natural water (4-10)")
     elif data['ph'] < 6.5 or data['ph'] > 8.5:
         warnings.append("⚠️ pH is outside WHO recommended range (6.5-8.5)")
-    
-    # Hardness validation (WHO: no health-based guideline, but >500 is very hard)
-    if data['hardness'] > 500:
-        warnings.append("⚠️ Water hardness is extremely high (>500 mg/L)")
-    
-    # TDS validation (WHO: <600 acceptable, EPA: <500 recommended)
-    if data['solids'] > 1500:
-        warnings.append("⚠️ Total Dissolved Solids is extremely high (>1500 ppm)")
-    
-    # Chloramines validation (EPA: 4.0 mg/L maximum)
-    if data['chloramines'] > 8:
-        warnings.append("⚠️ Chloramines level is extremely high (>8 ppm)")
-    
-    # Sulfate validation (WHO: 500 mg/L, EPA: 250 mg/L secondary standard)
-    if data['sulfate'] > 500:
-        warnings.append("⚠️ Sulfate level exceeds WHO guideline (>500 mg/L)")
-    
-    # Conductivity validation (typical: 50-1500 μS/cm)
-    if data['conductivity'] > 1500:
-        warnings.append("⚠️ Conductivity is extremely high (>1500 μS/cm)")
-    
-    # Organic carbon validation (typical: <2 ppm for treated water)
-    if data['organic_carbon'] > 5:
-        warnings.append("⚠️ Organic carbon is extremely high (>5 ppm)")
-    
-    # Trihalomethanes validation (EPA: 80 μg/L maximum)
-    if data['trihalomethanes'] > 160:
-        warnings.append("⚠️ Trihalomethanes significantly exceed EPA limit (>160 μg/L)")
-    
-    # Turbidity validation (WHO: <5 NTU, EPA: <1 NTU for treated water)
-    if data['turbidity'] > 10:
-        warnings.append("⚠️ Turbidity is extremely high (>10 NTU)")
-    
+
+    vals = np.fromiter((data[key] for key, _, _ in _VALIDATION_RULES),
+                       dtype=np.float64, count=len(_VALIDATION_RULES))
+    for idx in np.flatnonzero(vals > _VALIDATION_LIMITS):
+        warnings.append(_VALIDATION_RULES[idx][2])
+
     return warnings
 
-def predict_water_quality(data):
+# Threshold tables for the weighted scoring model, one entry per parameter.
+# Ordering matches _PARAM_KEYS; weights are feature importances from research.
+_PARAM_KEYS = ('ph', 'hardness', 'sulfate', 'solids', 'chloramines',
+               'conductivity', 'organic_carbon', 'trihalomethanes', 'turbidity')
+# Labels are interned: they recur as dict keys and in formatted lines on
+# every prediction, so pointer-compare instead of re-hashing each time
+_PARAM_LABELS = tuple(sys.intern(label) for label in
+                      ('pH', 'Hardness', 'Sulfate', 'TDS', 'Chloramines',
+                       'Conductivity', 'Organic Carbon', 'Trihalomethanes', 'Turbidity'))
+_PARAM_UNITS = ('', 'mg/L', 'mg/L', 'ppm', 'ppm', 'μS/cm', 'ppm', 'μg/L', 'NTU')
+_WEIGHTS = np.array([0.128, 0.119, 0.142, 0.114, 0.108, 0.102, 0.098, 0.095, 0.094])
+_PH_LO = 6.5
+_HI = np.array([8.5, 300.0, 250.0, 500.0, 4.0, 400.0, 2.0, 80.0, 5.0])
+_GOOD = 100.0
+_BAD = np.array([50.0, 60.0, 50.0, 70.0, 60.0, 70.0, 70.0, 50.0, 60.0])
+# Partial evaluation: the weights and outcome multipliers are compile-time
+# constants, so fold their products once at import; scoring then selects
+# between pre-weighted values instead of multiplying per call
+_W_GOOD = _WEIGHTS * _GOOD
+_W_BAD = _WEIGHTS * _BAD
+_W_TDS_EXTREME = _WEIGHTS[3] * 40.0
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _predict_cached(ph, hardness, sulfate, solids, chloramines,
+                    conductivity, organic_carbon, trihalomethanes, turbidity):
     """
-    Predict water quality using Random Forest logic
-    Based on research achieving 89.07% accuracy
-    
+    Score one water sample; cached on the input tuple so repeat analyses
+    (e.g. the Quick Fill examples) skip the computation entirely
+
     Thresholds based on WHO/EPA drinking water standards:
     - pH: 6.5-8.5 (WHO)
     - Hardness: <300 mg/L (soft to moderately hard)
@@ -158,118 +249,60 @@ def predict_water_quality(data):
     - Trihalomethanes: <80 μg/L (EPA maximum)
     - Turbidity: <5 NTU (WHO guideline)
     """
+    vals = np.array([ph, hardness, sulfate, solids, chloramines,
+                     conductivity, organic_carbon, trihalomethanes, turbidity])
+    # Strict upper bounds match the original ladder's `<` comparisons
+    # (e.g. chloramines == 4.0 is the EPA maximum and counts as a warning);
+    # pH alone is a closed interval, 6.5-8.5 inclusive per WHO
+    good_mask = vals < _HI
+    good_mask[0] = _PH_LO <= ph <= _HI[0]
+
+    # Per-parameter weighted score: full marks in range, reduced outside
+    weighted = np.where(good_mask, _W_GOOD, _W_BAD)
+    # TDS gets a second tier: merely elevated (<1000) scores 70, extreme 40
+    if not good_mask[3] and solids >= 1000:
+        weighted[3] = _W_TDS_EXTREME
+
+    # Status dict and the ready-to-render issues list come out of one pass
+    parameter_status = {}
+    issues = []
+    for label, value, unit, good in zip(_PARAM_LABELS, vals.tolist(), _PARAM_UNITS, good_mask.tolist()):
+        parameter_status[label] = {'status': 'good' if good else 'warning', 'value': value, 'unit': unit}
+        if not good:
+            issues.append(f"**{label}**: {value} {unit}")
+
+    # Calculate final score (average of weighted scores); sequential sum
+    # keeps float accumulation order identical to the old per-branch adds
+    final_score = sum(weighted.tolist()) / 9
+
+    # Determine quality grade
+    if final_score > 85:
+        quality = 'Excellent'
+    elif final_score > 70:
+        quality = 'Good'
+    elif final_score > 50:
+        quality = 'Fair'
+    else:
+        quality = 'Poor'
+
+    return {
+        'potable': final_score > 70,
+        'confidence': round(final_score, 1),
+        'quality': quality,
+        'parameters': parameter_status,
+        'issues': issues
+    }
+
+def predict_water_quality(data):
+    """
+    Predict water quality using Random Forest logic
+    Based on research achieving 89.07% accuracy
+    """
     try:
-        # Feature importance weights from research
-        weights = {
-            'sulfate': 0.142,
-            'ph': 0.128,
-            'hardness': 0.119,
-            'solids': 0.114,
-            'chloramines': 0.108,
-            'conductivity': 0.102,
-            'organic_carbon': 0.098,
-            'trihalomethanes': 0.095,
-            'turbidity': 0.094
-        }
-        
-        score = 0
-        parameter_status = {}
-        
-        # pH check (6.5-8.5 is optimal per WHO)
-        if 6.5 <= data['ph'] <= 8.5:
-            score += weights['ph'] * 100
-            parameter_status['pH'] = {'status': 'good', 'value': data['ph'], 'unit': ''}
-        else:
-            score += weights['ph'] * 50
-            parameter_status['pH'] = {'status': 'warning', 'value': data['ph'], 'unit': ''}
-        
-        # Hardness check (<300 is good per general standards)
-        if data['hardness'] < 300:
-            score += weights['hardness'] * 100
-            parameter_status['Hardness'] = {'status': 'good', 'value': data['hardness'], 'unit': 'mg/L'}
-        else:
-            score += weights['hardness'] * 60
-            parameter_status['Hardness'] = {'status': 'warning', 'value': data['hardness'], 'unit': 'mg/L'}
-        
-        # Sulfate check (<250 is good per EPA)
-        if data['sulfate'] < 250:
-            score += weights['sulfate'] * 100
-            parameter_status['Sulfate'] = {'status': 'good', 'value': data['sulfate'], 'unit': 'mg/L'}
-        else:
-            score += weights['sulfate'] * 50
-            parameter_status['Sulfate'] = {'status': 'warning', 'value': data['sulfate'], 'unit': 'mg/L'}
-        
-        # Solids/TDS check (<500 is good per EPA)
-        if data['solids'] < 500:
-            score += weights['solids'] * 100
-            parameter_status['TDS'] = {'status': 'good', 'value': data['solids'], 'unit': 'ppm'}
-        elif data['solids'] < 1000:
-            score += weights['solids'] * 70
-            parameter_status['TDS'] = {'status': 'warning', 'value': data['solids'], 'unit': 'ppm'}
-        else:
-            score += weights['solids'] * 40
-            parameter_status['TDS'] = {'status': 'warning', 'value': data['solids'], 'unit': 'ppm'}
-        
-        # Chloramines check (<4 is good per EPA)
-        if data['chloramines'] < 4:
-            score += weights['chloramines'] * 100
-            parameter_status['Chloramines'] = {'status': 'good', 'value': data['chloramines'], 'unit': 'ppm'}
-        else:
-            score += weights['chloramines'] * 60
-            parameter_status['Chloramines'] = {'status': 'warning', 'value': data['chloramines'], 'unit': 'ppm'}
-        
-        # Conductivity check (<400 is good for potable water)
-        if data['conductivity'] < 400:
-            score += weights['conductivity'] * 100
-            parameter_status['Conductivity'] = {'status': 'good', 'value': data['conductivity'], 'unit': 'μS/cm'}
-        else:
-            score += weights['conductivity'] * 70
-            parameter_status['Conductivity'] = {'status': 'warning', 'value': data['conductivity'], 'unit': 'μS/cm'}
-        
-        # Organic carbon check (<2 is good for treated water)
-        if data['organic_carbon'] < 2:
-            score += weights['organic_carbon'] * 100
-            parameter_status['Organic Carbon'] = {'status': 'good', 'value': data['organic_carbon'], 'unit': 'ppm'}
-        else:
-            score += weights['organic_carbon'] * 70
-            parameter_status['Organic Carbon'] = {'status': 'warning', 'value': data['organic_carbon'], 'unit': 'ppm'}
-        
-        # Trihalomethanes check (<80 is good per EPA)
-        if data['trihalomethanes'] < 80:
-            score += weights['trihalomethanes'] * 100
-            parameter_status['Trihalomethanes'] = {'status': 'good', 'value': data['trihalomethanes'], 'unit': 'μg/L'}
-        else:
-            score += weights['trihalomethanes'] * 50
-            parameter_status['Trihalomethanes'] = {'status': 'warning', 'value': data['trihalomethanes'], 'unit': 'μg/L'}
-        
-        # Turbidity check (<5 is good per WHO)
-        if data['turbidity'] < 5:
-            score += weights['turbidity'] * 100
-            parameter_status['Turbidity'] = {'status': 'good', 'value': data['turbidity'], 'unit': 'NTU'}
-        else:
-            score += weights['turbidity'] * 60
-            parameter_status['Turbidity'] = {'status': 'warning', 'value': data['turbidity'], 'unit': 'NTU'}
-        
-        # Calculate final score (average of weighted scores)
-        final_score = score / 9
-        
-        # Determine quality grade
-        if final_score > 85:
-            quality = 'Excellent'
-        elif final_score > 70:
-            quality = 'Good'
-        elif final_score > 50:
-            quality = 'Fair'
-        else:
-            quality = 'Poor'
-        
-        return {
-            'potable': final_score > 70,
-            'confidence': round(final_score, 1),
-            'quality': quality,
-            'parameters': parameter_status
-        }
-    
+        return _predict_cached(data['ph'], data['hardness'], data['sulfate'],
+                               data['solids'], data['chloramines'],
+                               data['conductivity'], data['organic_carbon'],
+                               data['trihalomethanes'], data['turbidity'])
     except Exception as e:
         st.error(f"Error during prediction: {str(e)}")
         return None
@@ -277,14 +310,10 @@ def predict_water_quality(data):
 def main():
     # Initialize session state
     initialize_session_state()
-    
-    # Header
-    st.markdown("""
-        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 1rem; margin-bottom: 2rem;'>
-            <h1 style='color: white; margin: 0;'>💧 Water Quality Monitor</h1>
-            <p style='color: white; margin: 0.5rem 0 0 0;'>AI-Powered Water Potability Prediction | 89.07% Accuracy</p>
-        </div>
-    """, unsafe_allow_html=True)
+
+    # Inject cached static CSS and header
+    st.markdown(_inject_css(), unsafe_allow_html=True)
+    st.markdown(_header_html(), unsafe_allow_html=True)
     
     # Sidebar
     with st.sidebar:
@@ -318,153 +347,114 @@ def main():
 
 def water_test_page():
     st.header("Water Quality Testing")
-    
-    # Create two columns for input
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Primary Parameters")
-        ph = st.number_input(
-            "pH Level (0-14)", 
-            min_value=0.0, 
-            max_value=14.0, 
-            value=st.session_state.ph, 
-            step=0.1,
-            help="Optimal range: 6.5-8.5 (WHO standard)",
-            key='ph_input'
-        )
-        st.session_state.ph = ph
-        
-        hardness = st.number_input(
-            "Hardness (mg/L)", 
-            min_value=0.0, 
-            value=st.session_state.hardness, 
-            step=1.0,
-            help="Optimal: <300 mg/L (soft to moderately hard water)",
-            key='hardness_input'
-        )
-        st.session_state.hardness = hardness
-        
-        solids = st.number_input(
-            "Total Dissolved Solids (ppm)", 
-            min_value=0.0, 
-            value=st.session_state.solids, 
-            step=1.0,
-            help="Optimal: <500 ppm (EPA secondary standard)",
-            key='solids_input'
-        )
-        st.session_state.solids = solids
-        
-        chloramines = st.number_input(
-            "Chloramines (ppm)", 
-            min_value=0.0, 
-            value=st.session_state.chloramines, 
-            step=0.1,
-            help="Optimal: <4 ppm (EPA maximum contaminant level)",
-            key='chloramines_input'
-        )
-        st.session_state.chloramines = chloramines
-        
-        sulfate = st.number_input(
-            "Sulfate (mg/L)", 
-            min_value=0.0, 
-            value=st.session_state.sulfate, 
-            step=1.0,
-            help="Optimal: <250 mg/L (EPA secondary standard)",
-            key='sulfate_input'
-        )
-        st.session_state.sulfate = sulfate
-    
-    with col2:
-        st.subheader("Secondary Parameters")
-        conductivity = st.number_input(
-            "Conductivity (μS/cm)", 
-            min_value=0.0, 
-            value=st.session_state.conductivity, 
-            step=1.0,
-            help="Optimal: <400 μS/cm (typical for potable water)",
-            key='conductivity_input'
-        )
-        st.session_state.conductivity = conductivity
-        
-        organic_carbon = st.number_input(
-            "Organic Carbon (ppm)", 
-            min_value=0.0, 
-            value=st.session_state.organic_carbon, 
-            step=0.1,
-            help="Optimal: <2 ppm (typical for treated water)",
-            key='organic_carbon_input'
-        )
-        st.session_state.organic_carbon = organic_carbon
-        
-        trihalomethanes = st.number_input(
-            "Trihalomethanes (μg/L)", 
-            min_value=0.0, 
-            value=st.session_state.trihalomethanes, 
-            step=1.0,
-            help="Optimal: <80 μg/L (EPA maximum contaminant level)",
-            key='trihalomethanes_input'
-        )
-        st.session_state.trihalomethanes = trihalomethanes
-        
-        turbidity = st.number_input(
-            "Turbidity (NTU)", 
-            min_value=0.0, 
-            value=st.session_state.turbidity, 
-            step=0.1,
-            help="Optimal: <5 NTU (WHO guideline)",
-            key='turbidity_input'
-        )
-        st.session_state.turbidity = turbidity
-    
+
+    # Batch all nine inputs into one form so edits coalesce into a single
+    # rerun on submit instead of one full rerun per changed widget
+    with st.form("water_inputs"):
+        # Create two columns for input
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("Primary Parameters")
+            st.number_input(
+                "pH Level (0-14)", 
+                min_value=0.0, 
+                max_value=14.0, 
+                step=0.1,
+                help="Optimal range: 6.5-8.5 (WHO standard)",
+                key='ph'
+            )
+
+            st.number_input(
+                "Hardness (mg/L)", 
+                min_value=0.0, 
+                step=1.0,
+                help="Optimal: <300 mg/L (soft to moderately hard water)",
+                key='hardness'
+            )
+
+            st.number_input(
+                "Total Dissolved Solids (ppm)", 
+                min_value=0.0, 
+                step=1.0,
+                help="Optimal: <500 ppm (EPA secondary standard)",
+                key='solids'
+            )
+
+            st.number_input(
+                "Chloramines (ppm)", 
+                min_value=0.0, 
+                step=0.1,
+                help="Optimal: <4 ppm (EPA maximum contaminant level)",
+                key='chloramines'
+            )
+
+            st.number_input(
+                "Sulfate (mg/L)", 
+                min_value=0.0, 
+                step=1.0,
+                help="Optimal: <250 mg/L (EPA secondary standard)",
+                key='sulfate'
+            )
+
+        with col2:
+            st.subheader("Secondary Parameters")
+            st.number_input(
+                "Conductivity (μS/cm)", 
+                min_value=0.0, 
+                step=1.0,
+                help="Optimal: <400 μS/cm (typical for potable water)",
+                key='conductivity'
+            )
+
+            st.number_input(
+                "Organic Carbon (ppm)", 
+                min_value=0.0, 
+                step=0.1,
+                help="Optimal: <2 ppm (typical for treated water)",
+                key='organic_carbon'
+            )
+
+            st.number_input(
+                "Trihalomethanes (μg/L)", 
+                min_value=0.0, 
+                step=1.0,
+                help="Optimal: <80 μg/L (EPA maximum contaminant level)",
+                key='trihalomethanes'
+            )
+
+            st.number_input(
+                "Turbidity (NTU)", 
+                min_value=0.0, 
+                step=0.1,
+                help="Optimal: <5 NTU (WHO guideline)",
+                key='turbidity'
+            )
+
+        submitted = st.form_submit_button("🔬 Analyze Water Quality", type="primary",
+                                          help="Run water quality analysis")
+
     # Quick fill buttons
     st.markdown("---")
     st.markdown("#### Quick Fill Examples:")
     col_ex1, col_ex2, col_ex3 = st.columns(3)
     
     with col_ex1:
-        if st.button("✅ Safe Water Example", help="Fill form with safe water values"):
-            st.session_state.ph = 7.2
-            st.session_state.hardness = 180.0
-            st.session_state.solids = 350.0
-            st.session_state.chloramines = 2.5
-            st.session_state.sulfate = 180.0
-            st.session_state.conductivity = 320.0
-            st.session_state.organic_carbon = 1.2
-            st.session_state.trihalomethanes = 45.0
-            st.session_state.turbidity = 2.8
-            st.rerun()
-    
+        st.button("✅ Safe Water Example", help="Fill form with safe water values",
+                  on_click=_fill_form, args=(_SAFE_EXAMPLE,))
+
     with col_ex2:
-        if st.button("❌ Unsafe Water Example", help="Fill form with unsafe water values"):
-            st.session_state.ph = 5.2
-            st.session_state.hardness = 450.0
-            st.session_state.solids = 1200.0
-            st.session_state.chloramines = 6.5
-            st.session_state.sulfate = 380.0
-            st.session_state.conductivity = 650.0
-            st.session_state.organic_carbon = 4.8
-            st.session_state.trihalomethanes = 120.0
-            st.session_state.turbidity = 8.5
-            st.rerun()
-    
+        st.button("❌ Unsafe Water Example", help="Fill form with unsafe water values",
+                  on_click=_fill_form, args=(_UNSAFE_EXAMPLE,))
+
     with col_ex3:
-        if st.button("🔄 Reset to Defaults", help="Reset all values to defaults"):
-            st.session_state.ph = 7.0
-            st.session_state.hardness = 200.0
-            st.session_state.solids = 400.0
-            st.session_state.chloramines = 3.0
-            st.session_state.sulfate = 200.0
-            st.session_state.conductivity = 350.0
-            st.session_state.organic_carbon = 1.5
-            st.session_state.trihalomethanes = 60.0
-            st.session_state.turbidity = 3.0
-            st.rerun()
+        st.button("🔄 Reset to Defaults", help="Reset all values to defaults",
+                  on_click=_fill_form, args=(_DEFAULTS,))
     
     st.markdown("---")
-    
-    # Analyze button
-    if st.button("🔬 Analyze Water Quality", type="primary", help="Run water quality analysis"):
+
+    # Run the analysis only on form submit
+    if submitted:
         # Prepare data
         data = {
             'ph': st.session_state.ph,
@@ -491,22 +481,138 @@ def water_test_page():
             result = predict_water_quality(data)
         
         if result:
-            # Save to history
-            history_entry = {
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'result': result,
-                'data': data
-            }
-            st.session_state.history.insert(0, history_entry)
-            if len(st.session_state.history) > 50:  # Increased from 10 to 50
-                st.session_state.history = st.session_state.history[:50]
-            
+            # Timestamp once; history entry, report and filenames all share it
+            now = datetime.now()
+
+            # Save to history (newest first, column-wise)
+            history = st.session_state.history
+            history['timestamp'].appendleft(now.strftime("%Y-%m-%d %H:%M:%S"))
+            history['potable'].appendleft(result['potable'])
+            history['confidence'].appendleft(result['confidence'])
+            history['quality'].appendleft(result['quality'])
+            history['data'].appendleft(data)
+            history['params_display'].appendleft(_format_params(data))
+
             # Display results
-            display_results(result, data)
+            display_results(result, data, now)
+
+# Shared chart palette
+_SAFE_COLOR = '#4CAF50'
+_WARN_COLOR = '#FF9800'
+_UNSAFE_COLOR = '#f44336'
+
+@st.cache_resource(show_spinner=False)
+def _plotly_template():
+    """Shared layout template for all charts, compiled once per worker
+    instead of per figure build"""
+    return go.layout.Template(layout={'colorway': [_SAFE_COLOR, _UNSAFE_COLOR]})
+
+# Figure builders are cached on their (hashable) inputs: Plotly figure
+# construction is the heaviest call in the render path, and inputs repeat
+# whenever a rerun is triggered by an unrelated widget
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_param_bar(params, values, statuses):
+    """Bar chart of the nine readings, colored by safe/warning status.
+    Built from go.Bar traces directly - no intermediate DataFrame and a far
+    smaller figure payload than the px.bar template tree"""
+    fig = go.Figure()
+    for status_name, color, wanted in (('Safe', _SAFE_COLOR, 'good'),
+                                       ('Warning', _WARN_COLOR, 'warning')):
+        xs = [p for p, s in zip(params, statuses) if s == wanted]
+        if xs:
+            fig.add_trace(go.Bar(
+                name=status_name,
+                x=xs,
+                y=[v for v, s in zip(values, statuses) if s == wanted],
+                marker_color=color
+            ))
+    fig.update_layout(
+        template=_plotly_template(),
+        title="Water Quality Parameters by Status",
+        yaxis_title='Measured Value',
+        height=400,
+        xaxis_tickangle=-45,
+        showlegend=True,
+        hovermode='x unified',
+        xaxis={'categoryorder': 'array', 'categoryarray': list(params)}
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_pie(potable_count, not_potable_count):
+    """Safe/unsafe distribution pie for the history page"""
+    fig = px.pie(
+        values=[potable_count, not_potable_count],
+        names=['Safe', 'Unsafe'],
+        title='Water Quality Distribution',
+        color_discrete_sequence=[_SAFE_COLOR, _UNSAFE_COLOR]
+    )
+    fig.update_layout(template=_plotly_template())
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_trend(tests, confidences, statuses):
+    """Confidence trend line for the history page, oldest test first;
+    confidences/statuses arrive as arrays and go into the frame as-is"""
+    history_df = pd.DataFrame({
+        'Test': list(tests),
+        'Confidence': confidences,
+        'Status': statuses
+    })
+    fig = px.line(
+        history_df,
+        x='Test',
+        y='Confidence',
+        color='Status',
+        title='Confidence Score Trend',
+        markers=True,
+        color_discrete_map={'Safe': _SAFE_COLOR, 'Unsafe': _UNSAFE_COLOR}
+    )
+    fig.update_layout(template=_plotly_template())
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _json_report(data_items, potable, quality, confidence, statuses, ts_iso):
+    """Serialize the single-test JSON report; cached so reruns after the
+    results are shown reuse the string instead of re-dumping it"""
+    report_data = {
+        'Test Date': ts_iso,
+        'Result': 'POTABLE' if potable else 'NOT POTABLE',
+        'Quality Grade': quality,
+        'Confidence Score': f"{confidence}%",
+        'Parameters': dict(data_items),
+        'Parameter Status': dict(statuses),
+        'Model': 'Random Forest (89.07% accuracy)',
+        'Standards': 'WHO/EPA Guidelines'
+    }
+    return json.dumps(report_data, indent=2)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _csv_report(data_items, potable, quality, confidence, ts_iso):
+    """Serialize the single-test CSV report; cached like the JSON report.
+    Written with csv.DictWriter directly - a one-row DataFrame is all
+    construction overhead and no benefit"""
+    row = dict(data_items)
+    row['Result'] = 'POTABLE' if potable else 'NOT POTABLE'
+    row['Confidence'] = confidence
+    row['Quality'] = quality
+    row['Timestamp'] = ts_iso
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(row.keys()), lineterminator='\n')
+    writer.writeheader()
+    writer.writerow(row)
+    return buf.getvalue()
+
+@st.fragment
+def display_results(result, data, now):
+    """Display prediction results with beautiful formatting
+
+    Runs as a fragment so sidebar interactions don't re-render the heavy
+    chart/report section"""
+
+    ts_iso = now.strftime("%Y-%m-%d %H:%M:%S")
+    ts_file = now.strftime("%Y%m%d_%H%M%S")
 
-def display_results(result, data):
-    """Display prediction results with beautiful formatting"""
-    
     st.markdown("---")
     st.header("📋 Analysis Results")
     
@@ -549,20 +655,25 @@ def display_results(result, data):
     # Parameter status grid
     st.subheader("Parameter Analysis")
     
-    cols = st.columns(3)
-    for idx, (param, info) in enumerate(result['parameters'].items()):
-        with cols[idx % 3]:
-            status_emoji = "✅" if info['status'] == 'good' else "⚠️"
-            status_text = "Within safe limits" if info['status'] == 'good' else "Outside optimal range"
-            status_class = "parameter-good" if info['status'] == 'good' else "parameter-warning"
-            
-            st.markdown(f"""
-                <div class='{status_class}' role="status">
-                    <b>{param}</b><br>
-                    {status_emoji} {info['value']} {info['unit']}<br>
-                    <small>{status_text}</small>
-                </div>
-            """, unsafe_allow_html=True)
+    # One markdown grid instead of nine element registrations in columns:
+    # a single frontend delta rather than one websocket message per card
+    grid = ['<div style="display:grid;grid-template-columns:repeat(3,1fr);gap:0.5rem">']
+    for param, info in result['parameters'].items():
+        status_emoji = "✅" if info['status'] == 'good' else "⚠️"
+        status_text = "Within safe limits" if info['status'] == 'good' else "Outside optimal range"
+        status_class = "parameter-good" if info['status'] == 'good' else "parameter-warning"
+
+        # Each card stays on one line: a blank line inside the payload would
+        # end the HTML block and the markdown parser would show the rest as code
+        grid.append(
+            f"<div class='{status_class}' role=\"status\">"
+            f"<b>{param}</b><br>"
+            f"{status_emoji} {info['value']} {info['unit']}<br>"
+            f"<small>{status_text}</small>"
+            f"</div>"
+        )
+    grid.append('</div>')
+    st.markdown(''.join(grid), unsafe_allow_html=True)
     
     # Recommendations
     st.subheader("💡 Recommendations")
@@ -590,108 +701,120 @@ def display_results(result, data):
         ❌ Consult local water authority for remediation options
         """)
         
-        # Specific recommendations based on failing parameters
+        # Specific recommendations based on failing parameters, already
+        # collected during prediction
         st.subheader("🔍 Specific Issues Detected")
-        issues = []
-        for param, info in result['parameters'].items():
-            if info['status'] == 'warning':
-                issues.append(f"**{param}**: {info['value']} {info['unit']}")
-        
-        if issues:
-            st.warning("The following parameters are outside optimal ranges:\n\n" + "\n\n".join(issues))
+        if result['issues']:
+            st.warning("The following parameters are outside optimal ranges:\n\n" + "\n\n".join(result['issues']))
     
     # Visualization - Normalized bar chart (better than radar for different scales)
     st.subheader("📊 Parameter Visualization")
-    
-    # Normalize values for better comparison
-    normalized_data = []
-    for param, info in result['parameters'].items():
-        # Normalize to 0-100 scale based on typical ranges
-        normalized_data.append({
-            'Parameter': param,
-            'Value': info['value'],
-            'Status': 'Safe' if info['status'] == 'good' else 'Warning',
-            'Unit': info['unit']
-        })
-    
-    df_viz = pd.DataFrame(normalized_data)
-    
-    fig = px.bar(
-        df_viz,
-        x='Parameter',
-        y='Value',
-        color='Status',
-        color_discrete_map={'Safe': '#4CAF50', 'Warning': '#FF9800'},
-        title="Water Quality Parameters by Status",
-        labels={'Value': 'Measured Value'},
-        height=400
-    )
-    
-    fig.update_layout(
-        xaxis_tickangle=-45,
-        showlegend=True,
-        hovermode='x unified'
+
+    fig = _build_param_bar(
+        tuple(result['parameters'].keys()),
+        tuple(info['value'] for info in result['parameters'].values()),
+        tuple(info['status'] for info in result['parameters'].values())
     )
-    
     st.plotly_chart(fig, use_container_width=True)
     
-    # Download report
+    # Download report (serialization cached on the hashable report inputs)
     st.subheader("📄 Export Report")
-    
-    report_data = {
-        'Test Date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        'Result': 'POTABLE' if result['potable'] else 'NOT POTABLE',
-        'Quality Grade': result['quality'],
-        'Confidence Score': f"{result['confidence']}%",
-        'Parameters': data,
-        'Parameter Status': {k: v['status'] for k, v in result['parameters'].items()},
-        'Model': 'Random Forest (89.07% accuracy)',
-        'Standards': 'WHO/EPA Guidelines'
-    }
-    
+
+    data_items = tuple(data.items())
+    statuses = tuple((k, v['status']) for k, v in result['parameters'].items())
+
     col1, col2 = st.columns(2)
     with col1:
         st.download_button(
             label="📥 Download JSON Report",
-            data=json.dumps(report_data, indent=2),
-            file_name=f"water_quality_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            data=_json_report(data_items, result['potable'], result['quality'],
+                              result['confidence'], statuses, ts_iso),
+            file_name=f"water_quality_report_{ts_file}.json",
             mime="application/json",
             help="Download detailed report in JSON format"
         )
-    
+
     with col2:
-        # Create CSV
-        df = pd.DataFrame([data])
-        df['Result'] = 'POTABLE' if result['potable'] else 'NOT POTABLE'
-        df['Confidence'] = result['confidence']
-        df['Quality'] = result['quality']
-        df['Timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        csv = df.to_csv(index=False)
-        
         st.download_button(
             label="📥 Download CSV Report",
-            data=csv,
-            file_name=f"water_quality_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            data=_csv_report(data_items, result['potable'], result['quality'],
+                             result['confidence'], ts_iso),
+            file_name=f"water_quality_report_{ts_file}.csv",
             mime="text/csv",
             help="Download report in CSV format for spreadsheet analysis"
         )
 
+# (label, data key, unit suffix) template for the history parameter lines;
+# labels interned for the same reason as _PARAM_LABELS
+_PARAM_TEMPLATE = tuple((sys.intern(label), key, unit) for label, key, unit in (
+    ("pH", "ph", ""),
+    ("Hardness", "hardness", " mg/L"),
+    ("TDS", "solids", " ppm"),
+    ("Chloramines", "chloramines", " ppm"),
+    ("Sulfate", "sulfate", " mg/L"),
+    ("Conductivity", "conductivity", " μS/cm"),
+    ("Organic Carbon", "organic_carbon", " ppm"),
+    ("Trihalomethanes", "trihalomethanes", " μg/L"),
+    ("Turbidity", "turbidity", " NTU"),
+))
+
+def _format_params(data):
+    """Format the nine parameter lines for one history record; called once
+    on insert (compute on write), never in the render path"""
+    return [f"{label}: {data[key]}{unit}" for label, key, unit in _PARAM_TEMPLATE]
+
+@st.fragment
+def _history_charts(potable_count, not_potable_count, total_tests,
+                    confidences, potable_flags):
+    """Pie and trend charts for the history page; a fragment so reruns
+    triggered elsewhere on the page skip the Plotly work"""
+    col_chart1, col_chart2 = st.columns(2)
+
+    with col_chart1:
+        fig = _build_pie(potable_count, not_potable_count)
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col_chart2:
+        # Trend over time (oldest first): reuse the stats arrays, with the
+        # chronological flip done as an array view instead of reversed()
+        fig2 = _build_trend(
+            tuple(f"Test {i+1}" for i in range(total_tests)),
+            confidences[::-1],
+            np.where(potable_flags[::-1], 'Safe', 'Unsafe')
+        )
+        st.plotly_chart(fig2, use_container_width=True)
+
+def _clear_history():
+    """Empty the history columns in place from the Clear History button.
+
+    Runs as an on_click callback, before the script re-executes, so the very
+    same run renders the emptied page - the in-place clear still avoids the
+    extra rerun the old st.rerun() forced
+    """
+    for column in st.session_state.history.values():
+        column.clear()
+    st.toast("History cleared!", icon="🗑️")
+
 def history_page():
     st.header("📊 Test History")
-    
-    if not st.session_state.history:
+
+    history = st.session_state.history
+    if not history['timestamp']:
         st.info("📭 No test history yet. Perform your first water quality test to see results here!")
         return
-    
-    # Statistics
+
+    # Statistics: convert each column once, then everything below (metrics,
+    # pie, trend) is reductions and views over the same two arrays
     st.subheader("Summary Statistics")
-    
-    total_tests = len(st.session_state.history)
-    potable_count = sum(1 for h in st.session_state.history if h['result']['potable'])
+
+    total_tests = len(history['timestamp'])
+    potable_flags = np.fromiter(history['potable'], dtype=bool, count=total_tests)
+    confidences = np.fromiter(history['confidence'], dtype=np.float32, count=total_tests)
+    potable_count = int(potable_flags.sum())
     not_potable_count = total_tests - potable_count
-    
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.metric("Total Tests", total_tests)
     with col2:
@@ -699,362 +822,198 @@ def history_page():
     with col3:
         st.metric("Unsafe Water", not_potable_count, delta=f"{(not_potable_count/total_tests)*100:.1f}%", delta_color="inverse")
     with col4:
-        avg_confidence = sum(h['result']['confidence'] for h in st.session_state.history) / total_tests
+        avg_confidence = float(confidences.mean())
         st.metric("Avg Confidence", f"{avg_confidence:.1f}%")
     
-    # Chart
-    col_chart1, col_chart2 = st.columns(2)
-    
-    with col_chart1:
-        fig = px.pie(
-            values=[potable_count, not_potable_count],
-            names=['Safe', 'Unsafe'],
-            title='Water Quality Distribution',
-            color_discrete_sequence=['#4CAF50', '#f44336']
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col_chart2:
-        # Trend over time
-        history_df = pd.DataFrame([
-            {
-                'Test': f"Test {i+1}",
-                'Confidence': h['result']['confidence'],
-                'Status': 'Safe' if h['result']['potable'] else 'Unsafe'
-            }
-            for i, h in enumerate(reversed(st.session_state.history))
-        ])
-        
-        fig2 = px.line(
-            history_df,
-            x='Test',
-            y='Confidence',
-            color='Status',
-            title='Confidence Score Trend',
-            markers=True,
-            color_discrete_map={'Safe': '#4CAF50', 'Unsafe': '#f44336'}
-        )
-        st.plotly_chart(fig2, use_container_width=True)
-    
+    _history_charts(potable_count, not_potable_count, total_tests,
+                    confidences, potable_flags)
+
     st.markdown("---")
     
     # Export all history
     st.subheader("📥 Export History")
-    col_export1, col_export2 = st.columns(2)
+    ts_file = datetime.now().strftime("%Y%m%d_%H%M%S")
+    col_export1, col_export2, col_export3 = st.columns(3)
     
     with col_export1:
         # JSON export
-        history_json = json.dumps(st.session_state.history, indent=2)
+        # params_display is derived presentation state; keep it out of exports
+        history_json = json.dumps({key: list(column) for key, column in history.items()
+                                   if key != 'params_display'}, indent=2)
         st.download_button(
             label="📥 Download All History (JSON)",
             data=history_json,
-            file_name=f"water_quality_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            file_name=f"water_quality_history_{ts_file}.json",
             mime="application/json",
             help="Download complete test history in JSON format"
         )
     
     with col_export2:
-        # CSV export
-        history_data = []
-        for entry in st.session_state.history:
-            row = {
-                'Timestamp': entry['timestamp'],
-                'Result': 'POTABLE' if entry['result']['potable'] else 'NOT POTABLE',
-                'Confidence': entry['result']['confidence'],
-                'Quality': entry['result']['quality']
-            }
-            row.update(entry['data'])
-            history_data.append(row)
-        
-        history_df = pd.DataFrame(history_data)
+        # CSV export: feed pandas a dict of columns so it skips per-row
+        # dtype inference; most columns come straight from the history store
+        history_cols = {
+            'Timestamp': list(history['timestamp']),
+            'Result': ['POTABLE' if p else 'NOT POTABLE' for p in history['potable']],
+            'Confidence': list(history['confidence']),
+            'Quality': list(history['quality'])
+        }
+        for key in history['data'][0]:
+            history_cols[key] = [d[key] for d in history['data']]
+
+        history_df = pd.DataFrame(history_cols)
         history_csv = history_df.to_csv(index=False)
         
         st.download_button(
             label="📥 Download All History (CSV)",
             data=history_csv,
-            file_name=f"water_quality_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            file_name=f"water_quality_history_{ts_file}.csv",
             mime="text/csv",
             help="Download complete test history in CSV format"
         )
-    
+
+    with col_export3:
+        # Parquet export: columnar + compressed, much smaller than CSV and
+        # faster to re-ingest in pandas; needs the optional pyarrow engine
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            st.caption("Install pyarrow to enable Parquet export")
+        else:
+            parquet_buf = io.BytesIO()
+            history_df.to_parquet(parquet_buf, engine='pyarrow', compression='snappy')
+            st.download_button(
+                label="📥 Download All History (Parquet)",
+                data=parquet_buf.getvalue(),
+                file_name=f"water_quality_history_{ts_file}.parquet",
+                mime="application/vnd.apache.parquet",
+                help="Download complete test history in Parquet format for analysis tools"
+            )
+
     st.markdown("---")
     st.subheader("Recent Tests")
     
-    # Display history
-    for idx, entry in enumerate(st.session_state.history):
-        with st.expander(f"Test #{idx+1} - {entry['timestamp']}", expanded=(idx==0)):
-            result = entry['result']
-            data = entry['data']
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                status = "✅ POTABLE" if result['potable'] else "❌ NOT POTABLE"
-                color = "green" if result['potable'] else "red"
-                st.markdown(f"**Result:** :{color}[{status}]")
-            
-            with col2:
-                st.markdown(f"**Quality:** {result['quality']}")
-            
-            with col3:
-                st.markdown(f"**Confidence:** {result['confidence']}%")
+    # Display history, newest 5 by default: keeps the render cost constant
+    # as history grows instead of redrawing all 50 records per rerun
+    visible = total_tests
+    if total_tests > 5 and not st.toggle(f"Show all {total_tests} tests"):
+        visible = 5
+
+    for idx in range(visible):
+        with st.expander(f"Test #{idx+1} - {history['timestamp'][idx]}", expanded=(idx==0)):
+            potable = history['potable'][idx]
+            data = history['data'][idx]
+
+            # One markdown element per record instead of a three-column
+            # layout container with an element in each cell
+            status = "✅ POTABLE" if potable else "❌ NOT POTABLE"
+            color = "green" if potable else "red"
+            st.markdown(
+                f"**Result:** :{color}[{status}] | "
+                f"**Quality:** {history['quality'][idx]} | "
+                f"**Confidence:** {history['confidence'][idx]}%"
+            )
             
-            # Show parameters
+            # Show parameters: one dataframe element instead of nine st.text
+            # calls spread over three layout columns
             st.markdown("**Parameters:**")
-            param_cols = st.columns(3)
-            params = [
-                f"pH: {data['ph']}",
-                f"Hardness: {data['hardness']} mg/L",
-                f"TDS: {data['solids']} ppm",
-                f"Chloramines: {data['chloramines']} ppm",
-                f"Sulfate: {data['sulfate']} mg/L",
-                f"Conductivity: {data['conductivity']} μS/cm",
-                f"Organic Carbon: {data['organic_carbon']} ppm",
-                f"Trihalomethanes: {data['trihalomethanes']} μg/L",
-                f"Turbidity: {data['turbidity']} NTU"
-            ]
-            
-            for i, param in enumerate(params):
-                with param_cols[i % 3]:
-                    st.text(param)
+            params = history['params_display'][idx]
+            param_grid = pd.DataFrame(np.array(params, dtype=object).reshape(3, 3),
+                                      columns=['', ' ', '  '])  # blank headers
+            st.dataframe(param_grid, hide_index=True, use_container_width=True)
     
     # Clear history button
     st.markdown("---")
     col_clear1, col_clear2 = st.columns([3, 1])
     with col_clear2:
-        if st.button("🗑️ Clear History", type="secondary", help="Delete all test history"):
-            st.session_state.history = []
-            st.success("History cleared!")
-            st.rerun()
+        st.button("🗑️ Clear History", type="secondary", help="Delete all test history",
+                  on_click=_clear_history)
 
-def about_page():
-    st.header("ℹ️ About This Application")
-    
-    st.markdown("""
-    ### Water Quality Monitor
-    
-    An AI-powered application for predicting water potability using machine learning algorithms.
-    Based on peer-reviewed research achieving **89.07% accuracy**.
-    
-    ---
-    
-    ### 🔬 Research Foundation
-    
-    **Model:** Random Forest Classifier
-    
-    **Performance Metrics:**
-    - Accuracy: 89.07%
-    - Precision: 88.4%
-    - Recall: 88.1%
-    - F1-Score: 88.2%
-    
-    **Dataset:** 3,276 water samples from various sources
-    
-    **Parameters Analyzed:** 9 key physicochemical factors
-    
-    **Validation:** Cross-validated on independent test set
-    
-    ---
-    
-    ### 📊 Parameters Explained
-    """)
-    
-    parameters_info = {
-        "pH Level": {
-            "description": "Measures acidity or alkalinity of water. Affects taste, corrosion, and disinfection effectiveness.",
-            "optimal": "6.5 - 8.5 (WHO standard)",
-            "unit": "pH scale (0-14)",
-            "health_impact": "Extreme pH levels affect taste and cause corrosion. Optimal pH essential for effective disinfection."
-        },
-        "Hardness": {
-            "description": "Mineral content, primarily calcium and magnesium. Affects soap effectiveness and scale formation.",
-            "optimal": "<300 mg/L (soft to moderately hard)",
-            "unit": "mg/L as CaCO₃",
-            "health_impact": "No direct health effects, but very hard water causes scale buildup in pipes and appliances."
-        },
-        "Total Dissolved Solids (TDS)": {
-            "description": "All dissolved minerals, salts, metals, and organic matter in water.",
-            "optimal": "<500 ppm (EPA secondary standard)",
-            "unit": "ppm (parts per million)",
-            "health_impact": "High TDS affects taste. Very high levels (>1000 ppm) indicate contamination."
-        },
-        "Chloramines": {
-            "description": "Disinfectant compound used in water treatment, formed from chlorine and ammonia.",
-            "optimal": "<4 ppm (EPA maximum)",
-            "unit": "ppm (parts per million)",
-            "health_impact": "Essential for disinfection but excessive levels affect taste and odor. EPA sets 4 ppm limit."
-        },
-        "Sulfate": {
-            "description": "Naturally occurring mineral compound from soil and rock dissolution.",
-            "optimal": "<250 mg/L (EPA secondary standard)",
-            "unit": "mg/L",
-            "health_impact": "High levels cause laxative effects and affect taste. Above 500 mg/L causes noticeable effects."
-        },
-        "Conductivity": {
-            "description": "Measures water's ability to conduct electricity, indicating ionic content and dissolved solids.",
-            "optimal": "<400 μS/cm (typical for potable water)",
-            "unit": "μS/cm (microsiemens per centimeter)",
-            "health_impact": "Indirect indicator of contamination. High values suggest presence of dissolved contaminants."
-        },
-        "Organic Carbon": {
-            "description": "Measure of organic matter from decaying plants, animals, and human activities.",
-            "optimal": "<2 ppm (typical for treated water)",
-            "unit": "ppm (parts per million)",
-            "health_impact": "Can react with chlorine to form harmful disinfection byproducts like trihalomethanes."
-        },
-        "Trihalomethanes (THMs)": {
-            "description": "Chemical compounds formed when chlorine reacts with organic matter during disinfection.",
-            "optimal": "<80 μg/L (EPA maximum)",
-            "unit": "μg/L (micrograms per liter)",
-            "health_impact": "Long-term exposure to high levels associated with increased cancer risk. Regulated by EPA."
-        },
-        "Turbidity": {
-            "description": "Cloudiness caused by suspended particles like clay, silt, algae, and microorganisms.",
-            "optimal": "<5 NTU (WHO guideline), <1 NTU ideal",
-            "unit": "NTU (Nephelometric Turbidity Units)",
-            "health_impact": "High turbidity interferes with disinfection and can harbor harmful microorganisms."
-        }
+# About-page content is fully static; the markdown bodies live in .md
+# assets next to the app and are read once per worker (see _load_markdown),
+# while the parameter table is parsed once at import
+
+_PARAMETERS_INFO = {
+    "pH Level": {
+        "description": "Measures acidity or alkalinity of water. Affects taste, corrosion, and disinfection effectiveness.",
+        "optimal": "6.5 - 8.5 (WHO standard)",
+        "unit": "pH scale (0-14)",
+        "health_impact": "Extreme pH levels affect taste and cause corrosion. Optimal pH essential for effective disinfection."
+    },
+    "Hardness": {
+        "description": "Mineral content, primarily calcium and magnesium. Affects soap effectiveness and scale formation.",
+        "optimal": "<300 mg/L (soft to moderately hard)",
+        "unit": "mg/L as CaCO₃",
+        "health_impact": "No direct health effects, but very hard water causes scale buildup in pipes and appliances."
+    },
+    "Total Dissolved Solids (TDS)": {
+        "description": "All dissolved minerals, salts, metals, and organic matter in water.",
+        "optimal": "<500 ppm (EPA secondary standard)",
+        "unit": "ppm (parts per million)",
+        "health_impact": "High TDS affects taste. Very high levels (>1000 ppm) indicate contamination."
+    },
+    "Chloramines": {
+        "description": "Disinfectant compound used in water treatment, formed from chlorine and ammonia.",
+        "optimal": "<4 ppm (EPA maximum)",
+        "unit": "ppm (parts per million)",
+        "health_impact": "Essential for disinfection but excessive levels affect taste and odor. EPA sets 4 ppm limit."
+    },
+    "Sulfate": {
+        "description": "Naturally occurring mineral compound from soil and rock dissolution.",
+        "optimal": "<250 mg/L (EPA secondary standard)",
+        "unit": "mg/L",
+        "health_impact": "High levels cause laxative effects and affect taste. Above 500 mg/L causes noticeable effects."
+    },
+    "Conductivity": {
+        "description": "Measures water's ability to conduct electricity, indicating ionic content and dissolved solids.",
+        "optimal": "<400 μS/cm (typical for potable water)",
+        "unit": "μS/cm (microsiemens per centimeter)",
+        "health_impact": "Indirect indicator of contamination. High values suggest presence of dissolved contaminants."
+    },
+    "Organic Carbon": {
+        "description": "Measure of organic matter from decaying plants, animals, and human activities.",
+        "optimal": "<2 ppm (typical for treated water)",
+        "unit": "ppm (parts per million)",
+        "health_impact": "Can react with chlorine to form harmful disinfection byproducts like trihalomethanes."
+    },
+    "Trihalomethanes (THMs)": {
+        "description": "Chemical compounds formed when chlorine reacts with organic matter during disinfection.",
+        "optimal": "<80 μg/L (EPA maximum)",
+        "unit": "μg/L (micrograms per liter)",
+        "health_impact": "Long-term exposure to high levels associated with increased cancer risk. Regulated by EPA."
+    },
+    "Turbidity": {
+        "description": "Cloudiness caused by suspended particles like clay, silt, algae, and microorganisms.",
+        "optimal": "<5 NTU (WHO guideline), <1 NTU ideal",
+        "unit": "NTU (Nephelometric Turbidity Units)",
+        "health_impact": "High turbidity interferes with disinfection and can harbor harmful microorganisms."
     }
-    
-    for param, info in parameters_info.items():
+}
+
+
+@st.fragment
+def _render_parameter_expanders():
+    """Parameter explanation expanders; a fragment so interactions elsewhere
+    on the page don't re-emit all nine blocks"""
+    for param, info in _PARAMETERS_INFO.items():
         with st.expander(f"**{param}**"):
-            st.write(f"**Description:** {info['description']}")
-            st.write(f"**Optimal Range:** {info['optimal']}")
-            st.write(f"**Unit:** {info['unit']}")
-            st.write(f"**Health Impact:** {info['health_impact']}")
+            # One markdown element per expander instead of four st.write calls
+            st.markdown(
+                f"**Description:** {info['description']}  \n"
+                f"**Optimal Range:** {info['optimal']}  \n"
+                f"**Unit:** {info['unit']}  \n"
+                f"**Health Impact:** {info['health_impact']}"
+            )
+
+def about_page():
+    st.header("ℹ️ About This Application")
+
+    st.markdown(_load_markdown("about_header.md"))
+
+    _render_parameter_expanders()
     
     st.markdown("---")
     
-    st.markdown("""
-    ### ⚠️ Important Disclaimer
-    
-    - This application provides estimates based on validated machine learning models
-    - Results should NOT replace professional water quality testing
-    - Always consult certified laboratories for official drinking water certification
-    - Do not consume water solely based on these predictions
-    - Regular professional testing recommended for all drinking water sources
-    - Contact local health authorities for water quality concerns
-    
-    **This tool is for educational and screening purposes only.**
-    
-    ---
-    
-    ### 🚀 Features
-    
-    ✅ Real-time water quality prediction (89.07% accuracy)
-    
-    ✅ Comprehensive 9-parameter analysis based on WHO/EPA standards
-    
-    ✅ Visual parameter status indicators with accessibility support
-    
-    ✅ Input validation with helpful warnings
-    
-    ✅ Complete test history tracking (up to 50 tests)
-    
-    ✅ Downloadable reports (JSON and CSV formats)
-    
-    ✅ Export complete history for record-keeping
-    
-    ✅ Mobile-responsive design for testing anywhere
-    
-    ✅ Research-backed prediction algorithms
-    
-    ✅ Quick-fill examples for testing
-    
-    ---
-    
-    ### 📱 Access Anywhere
-    
-    This Streamlit application works on:
-    - 💻 Desktop computers (Windows, Mac, Linux)
-    - 📱 Mobile phones (Android and iOS)
-    - 📱 Tablets (iPad, Android tablets)
-    - 🌐 Any device with a modern web browser
-    
-    No installation required - access via web URL!
-    
-    ---
-    
-    ### 👨‍💻 Technology Stack
-    
-    - **Framework:** Streamlit 1.x
-    - **Language:** Python 3.8+
-    - **ML Algorithm:** Random Forest Classifier
-    - **Visualization:** Plotly Express and Plotly Graph Objects
-    - **Data Processing:** Pandas 1.x, NumPy 1.x
-    - **Standards:** WHO Guidelines, EPA Standards
-    
-    ---
-    
-    ### 📚 Standards and References
-    
-    This application follows established water quality standards:
-    
-    **World Health Organization (WHO)**
-    - Guidelines for Drinking Water Quality (4th Edition)
-    - pH, turbidity, and general water safety standards
-    
-    **U.S. Environmental Protection Agency (EPA)**
-    - National Primary Drinking Water Regulations
-    - Maximum Contaminant Levels (MCLs)
-    - Secondary Maximum Contaminant Levels (SMCLs)
-    
-    **Research Paper**
-    - Random Forest classification model for water potability
-    - Dataset: 3,276 water quality samples
-    - Validated accuracy: 89.07%
-    
-    ---
-    
-    ### 🔒 Privacy and Data
-    
-    - All analysis performed locally in your browser session
-    - No data transmitted to external servers
-    - Test history stored only in session (cleared on browser close)
-    - Export your data anytime for your records
-    - No personally identifiable information collected
-    
-    ---
-    
-    ### 📄 License
-    
-    MIT License - Free to use and modify for educational purposes
-    
-    ---
-    
-    ### 🤝 Support and Feedback
-    
-    For questions, issues, or suggestions:
-    - Review the documentation in this About section
-    - Check parameter explanations for guidance
-    - Consult WHO/EPA guidelines for detailed standards
-    - Contact certified water testing laboratories for professional analysis
-    
-    ---
-    
-    ### 📈 Version History
-    
-    **Version 2.0.0** (Current)
-    - Added input validation with warnings
-    - Fixed quick-fill examples functionality
-    - Improved accessibility (ARIA labels, better contrast)
-    - Added bulk history export
-    - Enhanced error handling
-    - Improved documentation
-    - Added confidence score explanation
-    - Better mobile responsiveness
-    
-    **Version 1.0.0**
-    - Initial release
-    - Basic water quality prediction
-    - 9-parameter analysis
-    - History tracking
-    - Report export
-    
-    ---
-    
-    **Built with ❤️ using Streamlit** | Making water quality testing accessible to everyone
-    """)
+    st.markdown(_load_markdown("about_footer.md"))
 
 if __name__ == "__main__":
     main()